@@ -1,8 +1,134 @@
 import os
 import json
+import bisect
+import mmap
+import re
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox, simpledialog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+# Prefer the fastest available JSON codec. orjson only supports two-space
+# indentation, so it is used for parsing and ujson/json keep the saved files
+# in their existing four-space layout.
+def json_loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps(data):
+    if ujson is not None:
+        return ujson.dumps(data, indent=4, escape_forward_slashes=False).encode('utf-8')
+    return json.dumps(data, indent=4).encode('utf-8')
+
+def read_json_file(file_path):
+    with open(file_path, 'rb') as file:
+        # orjson can parse straight from a memory map, which skips copying the
+        # whole file into a bytes object; the other codecs need bytes.
+        if orjson is None or os.fstat(file.fileno()).st_size == 0:
+            return json_loads(file.read())
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+STREAM_WRITE_THRESHOLD = 10_000
+WRITE_BUFFER_SIZE = 1 << 20
+
+def write_json_file(file_path, data):
+    # Write next to the target and swap it in, so a failed save never leaves
+    # a truncated translation file behind.
+    temp_path = file_path + '.tmp'
+    try:
+        if len(data) < STREAM_WRITE_THRESHOLD:
+            payload = json_dumps(data)
+            with open(temp_path, 'wb') as file:
+                file.write(payload)
+        else:
+            # Large files are encoded incrementally into a big write buffer so
+            # the whole document is never held in memory as both str and bytes.
+            encoder = json.JSONEncoder(indent=4)
+            with open(temp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+                for chunk in encoder.iterencode(data):
+                    file.write(chunk.encode('utf-8'))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+MAX_LOAD_WORKERS = 8
+MAX_DIFF_ROWS = 20
+SEARCH_DELAY_MS = 150
+
+# Sort keys: alphabetic first, numeric next
+def key_order(key):
+    return (not key.isdigit(), key)
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class FileEntryDialog:
+    # A Toplevel with one Label/Entry row per loaded file. It is hidden rather
+    # than destroyed on close and its rows are reused, so reopening it only
+    # updates text instead of building new widgets.
+    def __init__(self, root, with_key=False):
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        self.first_row = 0
+        self.key_entry = None
+        if with_key:
+            tk.Label(self.window, text="Key").grid(row=0, column=0, padx=10, pady=5, sticky=tk.W)
+            self.key_entry = tk.Entry(self.window)
+            self.key_entry.grid(row=0, column=1, padx=10, pady=5)
+            self.first_row = 1
+        self.rows = []
+        self.ok_button = tk.Button(self.window, text="OK")
+
+    def show(self, title, file_names, values, command):
+        self.window.title(title)
+        if self.key_entry is not None:
+            self.key_entry.delete(0, tk.END)
+
+        while len(self.rows) < len(file_names):
+            self.rows.append((tk.Label(self.window), tk.Entry(self.window)))
+
+        inputs = {}
+        for index, (label, entry) in enumerate(self.rows):
+            if index >= len(file_names):
+                label.grid_remove()
+                entry.grid_remove()
+                continue
+            file_name = file_names[index]
+            row = self.first_row + index
+            label.config(text=file_name)
+            label.grid(row=row, column=0, padx=10, pady=5, sticky=tk.W)
+            entry.grid(row=row, column=1, padx=10, pady=5)
+            entry.delete(0, tk.END)
+            entry.insert(0, values.get(file_name, ""))
+            inputs[file_name] = entry
+
+        self.ok_button.config(command=command)
+        self.ok_button.grid(row=self.first_row + len(file_names), column=0, columnspan=2, pady=10)
+        self.window.deiconify()
+        self.window.lift()
+        return inputs
+
+    def hide(self):
+        self.window.withdraw()
+
 class JSONFileManagerApp:
     def __init__(self, root):
         self.root = root
@@ -10,7 +136,36 @@ class JSONFileManagerApp:
         self.json_data = {}
         self.json_frames = {}
         self.file_paths = {}
+        # Files with edits that have not been saved yet
+        self.dirty = set()
+        self.row_vars = {}
+        self.displayed_rows = {}
+        # Key shown on each listbox row, in the same order as displayed_rows
+        self.row_keys = {}
+        # key_order() tuples per file, kept sorted for display
+        self.sorted_keys = {}
+        # Search index: lowercase trigram -> keys
+        self.key_trigrams = {}
+        # Master key columns shared by every file: keys[i] and lower_keys[i]
+        # describe the same key and key_index maps a key to its position.
+        # Values stay in the per-file dicts so each file keeps its own order.
+        self.keys = []
+        self.lower_keys = []
+        self.key_index = {}
+        # key -> names of the files that contain it
+        self.key_to_files = {}
+        # lower_keys joined into one string for single-pass scans, built lazily
+        self.key_haystack = None
+        self.key_offsets = []
+        # Last compiled search pattern, reused while the query is unchanged
+        self.key_pattern = None
+        # Lowercased values per file; value searches scan these directly
+        self.lower_values = {}
         self.selectedKey= ''
+        self.search_after_id = None
+        # Dialogs are created on first use and reused afterwards
+        self.edit_dialog = None
+        self.add_dialog = None
 
         self.setup_toolbar()
         self.setup_main_frame()
@@ -27,6 +182,7 @@ class JSONFileManagerApp:
 
         self.search_entry = tk.Entry(toolbar)
         self.search_entry.pack(side=tk.LEFT, padx=2, pady=2)
+        self.search_entry.bind('<KeyRelease>', self.schedule_search)
 
         search_button = tk.Button(toolbar, text="Search Node", command=self.search_node)
         search_button.pack(side=tk.LEFT, padx=2, pady=2)
@@ -46,24 +202,39 @@ class JSONFileManagerApp:
             title="Select JSON Files",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
-        for file_path in file_paths:
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-                file_name = os.path.basename(file_path)
-                self.json_data[file_name] = data
-                self.file_paths[file_name] = file_path
-                self.display_json_file(file_name, data)
+        if not file_paths:
+            return
+
+        # Read and parse in worker threads; the widgets are built back on the
+        # Tk thread once everything has loaded.
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(file_paths))) as executor:
+            loaded = list(executor.map(read_json_file, file_paths))
+
+        for file_path, data in zip(file_paths, loaded):
+            file_name = os.path.basename(file_path)
+            if file_name in self.json_data:
+                self.unindex_file(file_name)
+            self.json_data[file_name] = data
+            self.index_file(file_name)
+            self.file_paths[file_name] = file_path
+            self.dirty.discard(file_name)
+            self.sorted_keys[file_name] = sorted(map(key_order, data))
+            self.display_json_file(file_name, data)
 
     def save_json_files(self):
-        for file_name, data in self.json_data.items():
-            file_path = self.file_paths[file_name]
-            with open(file_path, 'w') as file:
-                json.dump(data, file, indent=4)
-        messagebox.showinfo("Success", "All JSON files have been saved successfully.")
+        if not self.dirty:
+            messagebox.showinfo("Success", "No changes to save.")
+            return
+
+        saved = sorted(self.dirty)
+        for file_name in saved:
+            write_json_file(self.file_paths[file_name], self.json_data[file_name])
+            self.dirty.discard(file_name)
+        messagebox.showinfo("Success", "Saved: " + ", ".join(saved))
 
     def display_json_file(self, file_name, data):
         if file_name in self.json_frames:
-            self.json_frames[file_name].destroy()
+            self.json_frames[file_name][0].destroy()
 
         frame = tk.Frame(self.main_frame, borderwidth=2, relief=tk.GROOVE)
         frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -71,165 +242,295 @@ class JSONFileManagerApp:
         title = tk.Label(frame, text=file_name, font=("Arial", 12, "bold"))
         title.pack()
 
-        listbox = tk.Listbox(frame)
+        # The listbox only draws the rows in view; its contents live in a Tcl
+        # list variable so a refresh replaces every row in a single call.
+        rows_var = tk.Variable(frame, value=())
+        scrollbar = tk.Scrollbar(frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        listbox = tk.Listbox(frame, listvariable=rows_var, yscrollcommand=scrollbar.set)
         listbox.pack(fill=tk.BOTH, expand=True)
-        listbox.bind('<<ListboxSelect>>', self.on_listbox_select)
+        scrollbar.config(command=listbox.yview)
+        listbox.bind('<<ListboxSelect>>', lambda event, fn=file_name: self.on_listbox_select(event, fn))
         listbox.bind('<Double-1>', lambda event, fn=file_name: self.open_edit_window(event, fn))
         listbox.bind('<Delete>', self.delete_node)
-        for key, value in data.items():
-            listbox.insert(tk.END, f"{key}: {value}")
 
         self.json_frames[file_name] = (frame, listbox)
+        self.row_vars[file_name] = rows_var
+        self.displayed_rows[file_name] = []
+        self.row_keys[file_name] = []
         self.refresh_display(file_name)
 
-    def on_listbox_select(self, event):
+    def on_listbox_select(self, event, file_name):
         listbox = event.widget
         selection = listbox.curselection()
         if selection:
-            selected_text = listbox.get(selection[0])
-            key, _ = selected_text.split(": ", 1)
-            self.selectedKey = key
+            self.selectedKey = self.row_keys[file_name][selection[0]]
 
     def open_edit_window(self, event, file_name):
         listbox = event.widget
         selection = listbox.curselection()
         if selection:
-            selected_text = listbox.get(selection[0])
-            key, value = selected_text.split(": ", 1)
-
-            edit_window = tk.Toplevel(self.root)
-            edit_window.title(f"Edit Key: {key}")
+            key = self.row_keys[file_name][selection[0]]
 
-            inputs = {}
-            row = 0
-
-            for fn, data in self.json_data.items():
-                tk.Label(edit_window, text=fn).grid(row=row, column=0, padx=10, pady=5, sticky=tk.W)
-                entry = tk.Entry(edit_window)
-                entry.grid(row=row, column=1, padx=10, pady=5)
-                entry.insert(0, data.get(key, ""))
-                inputs[fn] = entry
-                row += 1
+            if self.edit_dialog is None:
+                self.edit_dialog = FileEntryDialog(self.root)
 
             def update_values():
                 for fn, entry in inputs.items():
-                    self.json_data[fn][key] = entry.get()
+                    data = self.json_data[fn]
+                    value = entry.get()
+                    if key in data:
+                        # Compare with the text the entry was filled with, so
+                        # unchanged numbers, booleans, null and nested values
+                        # keep their JSON type and leave the file clean.
+                        if values[fn] == value:
+                            continue
+                        self.unindex_value(fn, key)
+                    elif value == "":
+                        # The entry was shown blank for a file without the key
+                        continue
+                    else:
+                        self.insert_sorted_key(fn, key)
+                        self.key_to_files.setdefault(key, set()).add(fn)
+                        self.index_key(key)
+                    data[key] = value
+                    self.index_value(fn, key, value)
+                    self.dirty.add(fn)
                 self.refresh_display_all()
-                edit_window.destroy()
+                self.edit_dialog.hide()
 
-            ok_button = tk.Button(edit_window, text="OK", command=update_values)
-            ok_button.grid(row=row, column=0, columnspan=2, pady=10)
+            values = {fn: str(data[key]) if key in data else ""
+                      for fn, data in self.json_data.items()}
+            inputs = self.edit_dialog.show(f"Edit Key: {key}", list(self.json_data), values, update_values)
 
     def add_node(self):
-        # Create a new window for adding a node
-        add_window = tk.Toplevel(self.root)
-        add_window.title("Add Node")
-
-        row = 0
-
-        # Label and entry for the key
-        tk.Label(add_window, text="Key").grid(row=row, column=0, padx=10, pady=5, sticky=tk.W)
-        key_entry = tk.Entry(add_window)
-        key_entry.grid(row=row, column=1, padx=10, pady=5)
-        row += 1
-
-        inputs = {}
-
-        # Labels and entries for each file's value
-        for file_name in self.json_data.keys():
-            tk.Label(add_window, text=file_name).grid(row=row, column=0, padx=10, pady=5, sticky=tk.W)
-            entry = tk.Entry(add_window)
-            entry.grid(row=row, column=1, padx=10, pady=5)
-            inputs[file_name] = entry
-            row += 1
+        # Reuse the add window, with a key entry and one value entry per file
+        if self.add_dialog is None:
+            self.add_dialog = FileEntryDialog(self.root, with_key=True)
 
         def save_node():
-            key = key_entry.get().strip()
+            key = self.add_dialog.key_entry.get().strip()
             if not key:
                 messagebox.showerror("Error", "Key cannot be empty.")
                 return
             
-            # Check for duplicate key
-            for data in self.json_data.values():
-                if key in data:
-                    messagebox.showerror("Error", f"Key '{key}' already exists.")
-                    return            
+            # Check for duplicate key against the master key index
+            if key in self.key_index:
+                messagebox.showerror("Error", f"Key '{key}' already exists.")
+                return
 
             for file_name, entry in inputs.items():
                 value = entry.get().strip()
                 if value:
                     self.json_data[file_name][key] = value
+                    self.insert_sorted_key(file_name, key)
+                    self.key_to_files.setdefault(key, set()).add(file_name)
+                    self.index_value(file_name, key, value)
+                    self.index_key(key)
+                    self.dirty.add(file_name)
 
             self.refresh_display_all()
-            add_window.destroy()
+            self.add_dialog.hide()
 
-        # OK button to save the new node
-        ok_button = tk.Button(add_window, text="OK", command=save_node)
-        ok_button.grid(row=row, column=0, columnspan=2, pady=10)
+        inputs = self.add_dialog.show("Add Node", list(self.json_data), {}, save_node)
 
-    def delete_node(self):        
+    def delete_node(self, event=None):
         if self.selectedKey:            
             key = self.selectedKey
             confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{key}' across all files?")
             if confirm:
-                for fn, data in self.json_data.items():
-                    if key in data:
-                        del data[key]
-                self.refresh_display_all()
+                # Only the files that contain the key change, so only their
+                # rows are removed and every other listbox is left alone.
+                for fn in self.key_to_files.pop(key, ()):
+                    self.unindex_value(fn, key)
+                    self.remove_sorted_key(fn, key)
+                    del self.json_data[fn][key]
+                    self.dirty.add(fn)
+                    if fn in self.json_frames:
+                        self.show_rows(fn, [k for k in self.row_keys[fn] if k != key])
+                self.unindex_key(key)
+                self.selectedKey = ''
+
+    def insert_sorted_key(self, file_name, key):
+        bisect.insort(self.sorted_keys[file_name], key_order(key))
+
+    def remove_sorted_key(self, file_name, key):
+        sorted_keys = self.sorted_keys[file_name]
+        index = bisect.bisect_left(sorted_keys, key_order(key))
+        if index < len(sorted_keys) and sorted_keys[index][1] == key:
+            del sorted_keys[index]
+
+    def index_file(self, file_name):
+        self.lower_values[file_name] = {}
+        for key, value in self.json_data[file_name].items():
+            self.key_to_files.setdefault(key, set()).add(file_name)
+            self.index_key(key)
+            self.index_value(file_name, key, value)
+
+    def unindex_file(self, file_name):
+        # Drop a file's entries before it is replaced by a reload; keys that
+        # no other file has leave the master index too.
+        for key in self.json_data[file_name]:
+            files = self.key_to_files.get(key)
+            if files is not None:
+                files.discard(file_name)
+                if not files:
+                    del self.key_to_files[key]
+                    self.unindex_key(key)
+        del self.lower_values[file_name]
+
+    def index_key(self, key):
+        if key in self.key_index:
+            return
+        lowered = key.lower()
+        self.key_haystack = None
+        self.key_index[key] = len(self.keys)
+        self.keys.append(key)
+        self.lower_keys.append(lowered)
+        for gram in trigrams(lowered):
+            self.key_trigrams.setdefault(gram, set()).add(key)
+
+    def unindex_key(self, key):
+        index = self.key_index.pop(key, None)
+        if index is None:
+            return
+        lowered = self.lower_keys[index]
+        self.key_haystack = None
+
+        # Move the last key into the freed slot so removal stays O(1)
+        last_key = self.keys.pop()
+        last_lowered = self.lower_keys.pop()
+        if last_key != key:
+            self.keys[index] = last_key
+            self.lower_keys[index] = last_lowered
+            self.key_index[last_key] = index
+
+        for gram in trigrams(lowered):
+            postings = self.key_trigrams.get(gram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.key_trigrams[gram]
+
+    def scan_keys(self, search_key):
+        # A single character matches most keys, so a plain substring test per
+        # key beats stepping through every regex hit.
+        if len(search_key) == 1:
+            return {key for key, lowered in zip(self.keys, self.lower_keys)
+                    if search_key in lowered}
+
+        # One compiled-pattern scan over all lowercased keys joined by newlines
+        # replaces a Python-level substring test per key.
+        if self.key_haystack is None:
+            self.key_haystack = '\n'.join(self.lower_keys)
+            self.key_offsets = []
+            offset = 0
+            for lowered in self.lower_keys:
+                self.key_offsets.append(offset)
+                offset += len(lowered) + 1
+
+        haystack, offsets, lower_keys = self.key_haystack, self.key_offsets, self.lower_keys
+        if self.key_pattern is None or self.key_pattern.pattern != re.escape(search_key):
+            self.key_pattern = re.compile(re.escape(search_key))
+        pattern = self.key_pattern
+        matched_keys = set()
+        position = 0
+        while True:
+            match = pattern.search(haystack, position)
+            if match is None:
+                break
+            index = bisect.bisect_right(offsets, match.start()) - 1
+            matched_keys.add(self.keys[index])
+            # Skip the rest of this key; one hit is enough
+            position = offsets[index] + len(lower_keys[index]) + 1
+        return matched_keys
+
+    def index_value(self, file_name, key, value):
+        self.lower_values[file_name][key] = str(value).lower()
+
+    def unindex_value(self, file_name, key):
+        self.lower_values[file_name].pop(key, None)
+
+    def index_candidates(self, index, search_key):
+        # Returns None when the search text is too short to have a trigram
+        grams = trigrams(search_key)
+        if not grams:
+            return None
+        postings = sorted((index.get(gram, set()) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def schedule_search(self, event=None):
+        # Debounce live search so a burst of keystrokes runs a single search
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DELAY_MS, self.search_node)
 
     def search_node(self):
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+            self.search_after_id = None
+
         search_key = self.search_entry.get().strip().lower()
         if not search_key:
             self.refresh_display_all()
             return
 
-        matched_keys = set()
-        matched_results = []
-
-        # First pass: search for matching keys
-        for file_name, data in self.json_data.items():
-            for key, value in data.items():
-                if search_key in key.lower():
-                    matched_keys.add(key)
-                    matched_results.append((key, value, file_name))
+        # First pass: search for matching keys among the index candidates
+        candidates = self.index_candidates(self.key_trigrams, search_key)
+        if candidates is None:
+            matched_keys = self.scan_keys(search_key)
+        else:
+            lower_keys, key_index = self.lower_keys, self.key_index
+            matched_keys = {key for key in candidates if search_key in lower_keys[key_index[key]]}
 
         # Second pass: if no matching keys, search for matching values
         if not matched_keys:
-            for file_name, data in self.json_data.items():
-                for key, value in data.items():
-                    if search_key in str(value).lower():
-                        matched_keys.add(key)
-                        matched_results.append((key, value, file_name))
-
-        # Final pass: search for matched keys across all files
-        final_results = []
-        if matched_keys:
-            for file_name, data in self.json_data.items():
-                for key, value in data.items():
-                    if key in matched_keys:
-                        final_results.append((key, value, file_name))
-
-        # Clear and update the listboxes with sorted results
-        for file_name, (frame, listbox) in self.json_frames.items():
-            listbox.delete(0, tk.END)
-            for key, value, fn in sorted(final_results, key=lambda x: (x[2], x[0])):
-                if fn == file_name:
-                    listbox.insert(tk.END, f"{key}: {value}")
+            matched_keys = {key for values in self.lower_values.values()
+                            for key, lowered in values.items() if search_key in lowered}
 
-    def refresh_display(self, file_name):
-        _, listbox = self.json_frames[file_name]
-        listbox.delete(0, tk.END)
-        data = self.json_data[file_name]
+        # Final pass: bucket the matched keys by file, sorted once up front
+        sorted_matches = sorted(matched_keys)
+        keys_by_file = {}
+        for file_name, data in self.json_data.items():
+            keys_by_file[file_name] = [key for key in sorted_matches if key in data]
 
-        # Sort keys: alphabetic first, numeric next
-        sorted_keys = sorted(data.keys(), key=lambda x: (not x.isdigit(), x))
+        # Update the listboxes with sorted results
+        for file_name in self.json_frames.keys():
+            self.show_rows(file_name, keys_by_file.get(file_name, []))
+
+    def refresh_display(self, file_name):
+        self.show_rows(file_name, [key for _, key in self.sorted_keys[file_name]])
 
-        for key in sorted_keys:
-            value = data[key]
-            listbox.insert(tk.END, f"{key}: {value}")
+    def show_rows(self, file_name, keys):
+        data = self.json_data[file_name]
+        rows = [f"{key}: {data[key]}" for key in keys]
+        old_rows = self.displayed_rows[file_name]
+
+        # Trim the rows both lists share at the start and end
+        limit = min(len(old_rows), len(rows))
+        start = 0
+        while start < limit and old_rows[start] == rows[start]:
+            start += 1
+        old_end, new_end = len(old_rows), len(rows)
+        while old_end > start and new_end > start and old_rows[old_end - 1] == rows[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        if old_end - start > MAX_DIFF_ROWS or new_end - start > MAX_DIFF_ROWS:
+            # A large change is cheaper as one list-variable assignment
+            self.row_vars[file_name].set(tuple(rows))
+        else:
+            # Only touch the few rows that changed in the middle
+            _, listbox = self.json_frames[file_name]
+            if old_end > start:
+                listbox.delete(start, old_end - 1)
+            if new_end > start:
+                listbox.insert(start, *rows[start:new_end])
+        self.displayed_rows[file_name] = rows
+        self.row_keys[file_name] = keys
 
     def refresh_display_all(self):
-        self.search_entry = ''
+        self.search_entry.delete(0, tk.END)
         for file_name in self.json_frames.keys():
             self.refresh_display(file_name) 
 